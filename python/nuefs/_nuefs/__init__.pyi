@@ -97,11 +97,16 @@ def _default_socket_path() -> pathlib.Path:
     Get the default socket path for the daemon.
     """
 
-def _mount(root: builtins.str | os.PathLike | pathlib.Path, entries: typing.Sequence[ManifestEntry]) -> RawHandle:
+def _mount(root: builtins.str | os.PathLike | pathlib.Path, entries: typing.Iterable[ManifestEntry]) -> RawHandle:
     r"""
     Create a new mount.
     """
 
+def _mount_or_update(root: builtins.str | os.PathLike | pathlib.Path, entries: typing.Iterable[ManifestEntry]) -> RawHandle:
+    r"""
+    Create a mount, or replace the manifest of the existing mount at root.
+    """
+
 def _resolve(root: builtins.str | os.PathLike | pathlib.Path) -> typing.Optional[builtins.int]:
     r"""
     Resolve an existing mount by root. Returns mount_id if found.
@@ -122,7 +127,7 @@ def _unmount(mount_id: builtins.int) -> None:
     Unmount by mount_id.
     """
 
-def _update(mount_id: builtins.int, entries: typing.Sequence[ManifestEntry]) -> None:
+def _update(mount_id: builtins.int, entries: typing.Iterable[ManifestEntry]) -> None:
     r"""
     Update mount manifest.
     """
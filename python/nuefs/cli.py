@@ -1,11 +1,12 @@
 import os
 import pathlib
+import shutil
+import stat
 import subprocess
 import sys
 import time
 from typing import Annotated
 
-from rich.panel import Panel
 from sheaves.annotations import Commands, Flag, Option
 from sheaves.cli import Command, cli
 from sheaves.console import console
@@ -17,17 +18,18 @@ from .manifest import Manifest, print_tree
 
 
 def _lazy_unmount(root: pathlib.Path) -> None:
-    for cmd in ("fusermount3", "fusermount"):
+    for name in ("fusermount3", "fusermount"):
+        cmd = shutil.which(name)
+        if cmd is None:
+            continue
         try:
             subprocess.run(
-                [cmd, "-uz", str(root)],
+                [cmd, "-uz", os.fspath(root)],
                 check=True,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
             return
-        except FileNotFoundError:
-            continue
         except subprocess.CalledProcessError:
             continue
 
@@ -45,6 +47,8 @@ class Mount(NueBaseCommand):
     ] = False
 
     def run(self) -> None:
+        from rich.panel import Panel
+
         root = self.root
 
         if not self.dry_run:
@@ -64,8 +68,7 @@ class Mount(NueBaseCommand):
         if self.dry_run:
             return
 
-        with nuefs.open(root) as h:
-            h.update(list(entries.values()))
+        with nuefs.open(root, entries.values()):
             console.print(
                 Panel(
                     "Mount created, but your current shell is already inside the directory.\n"
@@ -96,8 +99,9 @@ class Unmount(Command, app_name="nue"):
                 pass
             return
 
+        # The daemon canonicalizes mount roots, so compare them as-is.
         for h in nuefs.status():
-            if os.path.normpath(h.root) == root:
+            if h.root == root:
                 h.unmount()
                 return
 
@@ -105,6 +109,7 @@ class Unmount(Command, app_name="nue"):
 class Status(NueBaseCommand):
     def run(self) -> None:
         import humanize
+        from rich.panel import Panel
 
         info = nuefs.daemon_info()
         uptime = int(time.time()) - info.started_at
@@ -136,9 +141,17 @@ class Stop(Command, app_name="nue"):
 def _daemon_running(socket_path: pathlib.Path) -> bool:
     import socket as sock
 
+    # A missing or stale socket path is the common "not running" case; one
+    # stat answers it without creating and connecting a socket.
+    try:
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            return False
+    except OSError:
+        return False
+
     try:
         s = sock.socket(sock.AF_UNIX, sock.SOCK_STREAM)
-        s.connect(str(socket_path))
+        s.connect(os.fspath(socket_path))
         s.close()
         return True
     except (FileNotFoundError, ConnectionRefusedError, OSError):
@@ -26,9 +26,9 @@ class Handle:
         """Mount root path (read-only)."""
         return self._root
 
-    def update(self, entries: collections.abc.Sequence[ManifestEntry]) -> None:
+    def update(self, entries: collections.abc.Iterable[ManifestEntry]) -> None:
         """Update the mount manifest."""
-        _ext._update(self._mount_id, list(entries))
+        _ext._update(self._mount_id, entries)
 
     def which(self, path: str) -> OwnerInfo | None:
         """Query which backend owns a path."""
@@ -54,21 +54,32 @@ class Handle:
         return False
 
 
-def open(root: str | os.PathLike[str] | pathlib.Path) -> Handle:
-    """Open a NueFS mount, creating an empty one if it doesn't exist."""
+def open(
+    root: str | os.PathLike[str] | pathlib.Path,
+    entries: collections.abc.Iterable[ManifestEntry] | None = None,
+) -> Handle:
+    """Open a NueFS mount, creating an empty one if it doesn't exist.
+
+    If entries are given, the mount is created with them or updated to them
+    in a single daemon call.
+    """
     root_path = pathlib.Path(root).expanduser().resolve()
 
+    if entries is not None:
+        raw = _ext._mount_or_update(root_path, entries)
+        return Handle(os.fspath(raw.root), raw.mount_id)
+
     mount_id = _ext._resolve(root_path)
     if mount_id is not None:
-        return Handle(str(root_path), mount_id)
+        return Handle(os.fspath(root_path), mount_id)
 
     raw = _ext._mount(root_path, [])
-    return Handle(str(raw.root), raw.mount_id)
+    return Handle(os.fspath(raw.root), raw.mount_id)
 
 
 def status() -> list[Handle]:
     """List all active mounts."""
-    return [Handle(str(h.root), h.mount_id) for h in _ext._status()]
+    return [Handle(os.fspath(h.root), h.mount_id) for h in _ext._status()]
 
 
 def daemon_info() -> DaemonInfo:
@@ -25,8 +25,8 @@ def default_gitdir_root() -> pathlib.Path:
 
 
 def _stable_id(worktree: pathlib.Path) -> str:
-    worktree = worktree.expanduser().resolve()
-    digest = hashlib.sha256(str(worktree).encode("utf-8")).hexdigest()
+    """Hash an already-resolved worktree path into a short directory name."""
+    digest = hashlib.sha256(os.fsencode(worktree)).hexdigest()
     return digest[:16]
 
 
@@ -83,6 +83,6 @@ def ensure_external_gitdir(
         # If the external path already exists, do not guess intent.
         raise FileExistsError(f"external gitdir already exists: {external}")
 
-    shutil.move(str(git_path), str(external))
+    shutil.move(git_path, external)
     git_path.write_text(f"gitdir: {external}\n", encoding="utf-8")
     return external
@@ -1,17 +1,22 @@
 """NueFS manifest models (nue.yaml)."""
 
 import collections.abc
+import concurrent.futures
+import os
 import pathlib
-from typing import Literal
+import stat
+from typing import TYPE_CHECKING, Literal
 
 import pydantic
-from rich.tree import Tree
 from sheaves.console import console
 from sheaves.sheaf import Sheaf
 from sheaves.typing import Pathspec
 
 import nuefs._nuefs as _ext
 
+if TYPE_CHECKING:
+    from rich.tree import Tree
+
 # Default excludes: caches, build artifacts, VCS directories
 DEFAULT_EXCLUDE = Pathspec(
     [".git", ".pixi", "node_modules", "__pycache__", ".venv", "target"]
@@ -31,11 +36,7 @@ class MountEntry(pydantic.BaseModel):
     def resolve(self, root: pathlib.Path) -> dict[str, _ext.ManifestEntry]:
         """Resolve this mount entry into ManifestEntry mappings."""
         return {
-            vpath: _ext.ManifestEntry(
-                virtual_path=vpath,
-                backend_path=path,
-                is_dir=is_dir,
-            )
+            vpath: _ext.ManifestEntry(vpath, path, is_dir)
             for vpath, path, is_dir in self._iter_entries(root)
         }
 
@@ -43,86 +44,88 @@ class MountEntry(pydantic.BaseModel):
         path = f"{name}/" if is_dir else name
         return self.exclude.match(path) and not self.include.match(path)
 
-    def _collapse_chain(
-        self,
-        dir_path: pathlib.Path,
-        rel_name: str,
-    ) -> tuple[pathlib.Path, str]:
+    def _collapse_chain(self, dir_path: str, rel_name: str) -> tuple[str, str]:
         """Collapse single-child directory chains into minimal cover prefix."""
         while True:
-            dirs: list[pathlib.Path] = []
+            dirs: list[os.DirEntry[str]] = []
             has_files = False
-            for item in dir_path.iterdir():
-                is_dir = item.is_dir() and not item.is_symlink()
-                if self._is_excluded(item.name, is_dir=is_dir):
-                    continue
-                if is_dir:
-                    dirs.append(item)
-                else:
-                    has_files = True
-                    break
+            with os.scandir(dir_path) as it:
+                for item in it:
+                    is_dir = item.is_dir(follow_symlinks=False)
+                    if self._is_excluded(item.name, is_dir=is_dir):
+                        continue
+                    if is_dir:
+                        dirs.append(item)
+                    else:
+                        has_files = True
+                        break
             if has_files or len(dirs) != 1:
                 break
-            dir_path = dirs[0]
+            dir_path = dirs[0].path
             rel_name = f"{rel_name}/{dirs[0].name}"
         return dir_path, rel_name
 
     def _resolve_source(
         self,
         root: pathlib.Path,
-    ) -> tuple[pathlib.Path, str, bool]:
-        """Return (resolved_source, prefix, expand_contents)."""
+    ) -> tuple[pathlib.Path, str, bool, int]:
+        """Return (resolved_source, prefix, expand_contents, st_mode).
+
+        st_mode is 0 when the source does not exist.
+        """
         raw = self.source.strip()
         expand_contents = raw.endswith("/") or raw in (".", "./")
 
-        source = pathlib.Path(raw).expanduser()
-        if not source.is_absolute():
-            source = (root / source).resolve()
-        else:
-            source = source.resolve()
+        source = (root / pathlib.Path(raw).expanduser()).resolve()
+        try:
+            mode = os.stat(source).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            mode = 0
 
         if self.dest:
             prefix = self.dest.strip().strip("/")
-        elif expand_contents or source.is_file():
+        elif expand_contents or stat.S_ISREG(mode):
             prefix = ""
         else:
             prefix = source.name
 
-        return source, prefix, expand_contents
+        return source, prefix, expand_contents, mode
 
     def _iter_entries(
         self,
         root: pathlib.Path,
-    ) -> collections.abc.Iterator[tuple[str, pathlib.Path, bool]]:
+    ) -> collections.abc.Iterator[tuple[str, str, bool]]:
         """Yield (vpath, backend_path, is_dir) for all resolved entries."""
-        source, prefix, expand_contents = self._resolve_source(root)
-
-        if not source.exists():
-            return
+        source, prefix, expand_contents, mode = self._resolve_source(root)
 
         # Single file
-        if source.is_file():
+        if stat.S_ISREG(mode):
             vpath = prefix if prefix else source.name
             if not self._is_excluded(vpath):
-                yield vpath, source, False
+                yield vpath, os.fspath(source), False
+            return
+
+        if not stat.S_ISDIR(mode):
             return
 
         # Directory without trailing slash: single entry
         if not expand_contents:
-            yield prefix, source, True
+            yield prefix, os.fspath(source), True
             return
 
-        # Trailing slash: expand contents
-        for item in source.iterdir():
-            is_dir = item.is_dir() and not item.is_symlink()
-            name = item.name
-            if self._is_excluded(name, is_dir=is_dir):
-                continue
-            path = item
-            if is_dir:
-                path, name = self._collapse_chain(path, name)
-            vpath = f"{prefix}/{name}" if prefix else name
-            yield vpath, path, is_dir
+        # Trailing slash: expand contents. DirEntry.is_dir() answers from the
+        # readdir d_type, so no extra stat per entry.
+        vprefix = f"{prefix}/" if prefix else ""
+        with os.scandir(source) as it:
+            for item in it:
+                is_dir = item.is_dir(follow_symlinks=False)
+                name = item.name
+                if self._is_excluded(name, is_dir=is_dir):
+                    continue
+                path = item.path
+                if is_dir:
+                    path, name = self._collapse_chain(path, name)
+                yield vprefix + name, path, is_dir
 
 
 class Manifest(Sheaf, app_name="nue"):
@@ -139,10 +142,14 @@ class Manifest(Sheaf, app_name="nue"):
         self,
     ) -> collections.abc.Iterator[tuple[MountEntry, dict[str, _ext.ManifestEntry]]]:
         root = self.root.expanduser().resolve()
-        for mount in self.mounts:
-            resolved = mount.resolve(root)
-            if resolved:
-                yield mount, resolved
+        # Mounts are independent subtrees and scandir releases the GIL, so scan
+        # them concurrently; results are still yielded in manifest order.
+        with concurrent.futures.ThreadPoolExecutor() as pool:
+            futures = [(mount, pool.submit(mount.resolve, root)) for mount in self.mounts]
+            for mount, future in futures:
+                resolved = future.result()
+                if resolved:
+                    yield mount, resolved
 
 
 def print_tree(
@@ -150,6 +157,8 @@ def print_tree(
     sources: list[tuple[MountEntry, dict[str, _ext.ManifestEntry]]],
     entries: dict[str, _ext.ManifestEntry],
 ) -> None:
+    from rich.tree import Tree
+
     source_tree = Tree(f"[bold blue]{root}[/] [dim](sources)[/]")
     for mount_entry, resolved in sources:
         branch = source_tree.add(f"[bold yellow]{mount_entry.source}[/]")
@@ -162,21 +171,28 @@ def print_tree(
     console.print(merged_tree)
 
 
-def _render_entries(root_node: Tree, entries: dict[str, _ext.ManifestEntry]) -> None:
-    nodes: dict[str, Tree] = {"": root_node}
-
-    def _ensure_parent(path: str) -> Tree:
-        if path in nodes:
-            return nodes[path]
-        parent, _, name = path.rpartition("/")
-        node = _ensure_parent(parent).add(f"[bold cyan]{name}/[/]")
-        nodes[path] = node
-        return node
+def _render_entries(root_node: "Tree", entries: dict[str, _ext.ManifestEntry]) -> None:
+    # Sorting by path components visits every directory before its
+    # descendants, so the open ancestors form a stack: `path[i]` is the name
+    # of `stack[i + 1]`.
+    stack: list[Tree] = [root_node]
+    path: list[str] = []
+    for parts, vpath in sorted((vpath.split("/"), vpath) for vpath in entries):
+        *parents, name = parts
+        depth = 0
+        for have, want in zip(path, parents):
+            if have != want:
+                break
+            depth += 1
+        del path[depth:], stack[depth + 1 :]
+        for part in parents[depth:]:
+            stack.append(stack[-1].add(f"[bold cyan]{part}/[/]"))
+            path.append(part)
 
-    for entry in sorted(entries.values(), key=lambda e: e.virtual_path):
-        parent, _, name = entry.virtual_path.rpartition("/")
+        entry = entries[vpath]
         if entry.is_dir:
             label = f"[bold cyan]{name}/[/] [dim]→ {entry.backend_path}[/]"
         else:
             label = f"{name} [dim]→ {entry.backend_path}[/]"
-        nodes[entry.virtual_path] = _ensure_parent(parent).add(label)
+        stack.append(stack[-1].add(label))
+        path.append(name)
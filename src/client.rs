@@ -104,6 +104,14 @@ impl Client {
         self.call_daemon(|ctx| self.inner.update(ctx, mount_id, entries))
     }
 
+    pub fn mount_or_update(
+        &self,
+        root: PathBuf,
+        entries: Vec<ManifestEntry>,
+    ) -> Result<u64, ClientError> {
+        self.call_daemon(|ctx| self.inner.mount_or_update(ctx, root, entries))
+    }
+
     pub fn resolve(&self, root: PathBuf) -> Result<Option<u64>, ClientError> {
         self.call(|ctx| self.inner.resolve(ctx, root))
     }
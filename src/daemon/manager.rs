@@ -61,10 +61,19 @@ impl Manager {
         root: PathBuf,
         entries: Vec<ManifestEntry>,
     ) -> Result<u64, ManagerError> {
-        let entry_count = entries.len();
         let root = root
             .canonicalize()
             .map_err(|e| ManagerError::InvalidRoot(e.to_string()))?;
+        self.mount_canonical(root, entries)
+    }
+
+    /// Mount at a root that has already been canonicalized.
+    fn mount_canonical(
+        &mut self,
+        root: PathBuf,
+        entries: Vec<ManifestEntry>,
+    ) -> Result<u64, ManagerError> {
+        let entry_count = entries.len();
 
         if self.mounts_by_root.contains_key(&root) {
             warn!(root = %root.display(), "mount rejected: already mounted");
@@ -178,6 +187,25 @@ impl Manager {
         Ok(self.mounts_by_root.get(&root).copied())
     }
 
+    /// Update the mount at `root` if one exists, otherwise create it.
+    pub fn mount_or_update(
+        &mut self,
+        root: PathBuf,
+        entries: Vec<ManifestEntry>,
+    ) -> Result<u64, ManagerError> {
+        let root = root
+            .canonicalize()
+            .map_err(|e| ManagerError::InvalidRoot(e.to_string()))?;
+
+        match self.mounts_by_root.get(&root).copied() {
+            Some(mount_id) => {
+                self.update(mount_id, entries)?;
+                Ok(mount_id)
+            }
+            None => self.mount_canonical(root, entries),
+        }
+    }
+
     pub fn update(
         &mut self,
         mount_id: u64,
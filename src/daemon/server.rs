@@ -115,6 +115,22 @@ impl NuefsService for NuefsServer {
         result
     }
 
+    async fn mount_or_update(
+        self,
+        _: tarpc::context::Context,
+        root: PathBuf,
+        entries: Vec<ManifestEntry>,
+    ) -> Result<u64, String> {
+        let entry_count = entries.len();
+        info!(root = %root.display(), entries = entry_count, "RPC mount_or_update");
+        let result = self.manager_call(|m| m.mount_or_update(root, entries)).await;
+        match &result {
+            Ok(mount_id) => info!(mount_id, "mount_or_update succeeded"),
+            Err(e) => warn!(error = %e, "mount_or_update failed"),
+        }
+        result
+    }
+
     async fn resolve(self, _: tarpc::context::Context, root: PathBuf) -> Option<u64> {
         debug!(root = %root.display(), "RPC resolve");
         self.manager_call(|m| m.resolve(root)).await.ok().flatten()
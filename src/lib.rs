@@ -175,15 +175,28 @@ pub struct RawHandle {
     pub mount_id: u64,
 }
 
+/// Collect manifest entries from any Python iterable without an intermediate list.
+fn extract_entries(entries: &Bound<'_, PyAny>) -> PyResult<Vec<types::ManifestEntry>> {
+    let mut out = Vec::with_capacity(entries.len().unwrap_or(0));
+    for item in entries.try_iter()? {
+        out.push(item?.extract::<ManifestEntry>()?.into());
+    }
+    Ok(out)
+}
+
 /// Create a new mount.
 #[gen_stub_pyfunction]
 #[pyfunction]
-fn _mount(root: PathBuf, entries: Vec<ManifestEntry>) -> PyResult<RawHandle> {
+fn _mount(
+    root: PathBuf,
+    #[gen_stub(override_type(type_repr = "typing.Iterable[ManifestEntry]", imports = ("typing")))]
+    entries: &Bound<'_, PyAny>,
+) -> PyResult<RawHandle> {
     let root = root.canonicalize().map_err(|e| {
         PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Invalid root path: {e}"))
     })?;
 
-    let entries: Vec<types::ManifestEntry> = entries.into_iter().map(Into::into).collect();
+    let entries = extract_entries(entries)?;
 
     let client = Client::new().map_err(to_pyerr)?;
     let mount_id = client.mount(root.clone(), entries).map_err(to_pyerr)?;
@@ -191,6 +204,26 @@ fn _mount(root: PathBuf, entries: Vec<ManifestEntry>) -> PyResult<RawHandle> {
     Ok(RawHandle { root, mount_id })
 }
 
+/// Create a mount, or replace the manifest of the existing mount at root.
+#[gen_stub_pyfunction]
+#[pyfunction]
+fn _mount_or_update(
+    root: PathBuf,
+    #[gen_stub(override_type(type_repr = "typing.Iterable[ManifestEntry]", imports = ("typing")))]
+    entries: &Bound<'_, PyAny>,
+) -> PyResult<RawHandle> {
+    let root = root.canonicalize().map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Invalid root path: {e}"))
+    })?;
+
+    let entries = extract_entries(entries)?;
+
+    let client = Client::new().map_err(to_pyerr)?;
+    let mount_id = client.mount_or_update(root.clone(), entries).map_err(to_pyerr)?;
+
+    Ok(RawHandle { root, mount_id })
+}
+
 /// Unmount by mount_id.
 #[gen_stub_pyfunction]
 #[pyfunction]
@@ -242,8 +275,12 @@ fn _which(mount_id: u64, path: String) -> PyResult<Option<OwnerInfo>> {
 /// Update mount manifest.
 #[gen_stub_pyfunction]
 #[pyfunction]
-fn _update(mount_id: u64, entries: Vec<ManifestEntry>) -> PyResult<()> {
-    let entries: Vec<types::ManifestEntry> = entries.into_iter().map(Into::into).collect();
+fn _update(
+    mount_id: u64,
+    #[gen_stub(override_type(type_repr = "typing.Iterable[ManifestEntry]", imports = ("typing")))]
+    entries: &Bound<'_, PyAny>,
+) -> PyResult<()> {
+    let entries = extract_entries(entries)?;
 
     let client = Client::new().map_err(to_pyerr)?;
     client.update(mount_id, entries).map_err(to_pyerr)
@@ -283,6 +320,7 @@ fn _nuefs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<OwnerInfo>()?;
     m.add_class::<DaemonInfo>()?;
     m.add_function(wrap_pyfunction!(_mount, m)?)?;
+    m.add_function(wrap_pyfunction!(_mount_or_update, m)?)?;
     m.add_function(wrap_pyfunction!(_unmount, m)?)?;
     m.add_function(wrap_pyfunction!(_status, m)?)?;
     m.add_function(wrap_pyfunction!(_daemon_info, m)?)?;
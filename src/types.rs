@@ -38,4 +38,6 @@ pub trait NuefsService {
     async fn update(mount_id: u64, entries: Vec<ManifestEntry>) -> Result<(), String>;
     async fn resolve(root: PathBuf) -> Option<u64>;
     async fn shutdown() -> Result<(), String>;
+    // Appended so existing requests keep their wire indices for older daemons.
+    async fn mount_or_update(root: PathBuf, entries: Vec<ManifestEntry>) -> Result<u64, String>;
 }
@@ -5,7 +5,57 @@ import pathlib
 import pytest
 from sheaves.typing import Pathspec
 
-from nuefs.manifest import DEFAULT_EXCLUDE, Manifest, MountEntry
+import nuefs
+from nuefs.manifest import DEFAULT_EXCLUDE, Manifest, MountEntry, _render_entries
+
+BASIC_YAML = """\
+apiVersion: nue/v1
+mounts:
+- source: ./sources/project-a/
+  exclude:
+    - '*.pyc'
+    - __pycache__/
+    - .git/
+- source: ./sources/libs
+  dest: vendor
+"""
+
+MULTI_YAML = """\
+apiVersion: nue/v1
+mounts:
+- source: ./sources/base/
+- source: ./sources/override/
+"""
+
+
+@pytest.fixture(scope="session")
+def fixtures_dir() -> pathlib.Path:
+    return pathlib.Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def basic_manifest(fixtures_dir: pathlib.Path) -> Manifest:
+    return Manifest.load(config_path=fixtures_dir / "nue.yaml")
+
+
+@pytest.fixture(scope="session")
+def multi_manifest(fixtures_dir: pathlib.Path) -> Manifest:
+    return Manifest.load(config_path=fixtures_dir / "nue-multi.yaml")
+
+
+@pytest.fixture(scope="session")
+def manifest_yaml_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> pathlib.Path:
+    """Write each manifest flavour once as <flavour>/nue.yaml.
+
+    The directory itself has no nue.yaml, for the missing-manifest case.
+    """
+    root = tmp_path_factory.mktemp("manifests")
+    for name, content in (("basic", BASIC_YAML), ("multi", MULTI_YAML)):
+        (root / name).mkdir()
+        (root / name / "nue.yaml").write_text(content)
+    return root
 
 
 class TestMountEntry:
@@ -124,75 +174,83 @@ class TestTrailingSlashSemantics:
         assert "bar.txt" in result
 
 
+@pytest.fixture(scope="session")
+def collapse_trees(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[str, pathlib.Path]:
+    """Build each collapse test tree once; resolve() never mutates them."""
+    shapes = {
+        "single_chain": (["a/b"], ["a/b/c"]),
+        "multi_child": (["a/x", "a/y"], ["a/x/f.txt", "a/y/g.txt"]),
+        "file_sibling": (["a/sub"], ["a/readme.txt"]),
+        "deep_chain": (["a/b/c/d"], ["a/b/c/d/file.txt"]),
+        "excluded_sibling": (["a/real", "a/__pycache__"], ["a/real/f.txt"]),
+    }
+    root = tmp_path_factory.mktemp("collapse")
+    trees: dict[str, pathlib.Path] = {}
+    for name, (dirs, files) in shapes.items():
+        tree = root / name
+        for d in dirs:
+            (tree / d).mkdir(parents=True)
+        for f in files:
+            (tree / f).touch()
+        trees[name] = tree
+    return trees
+
+
 class TestCollapseSingleChildDirs:
     """Tests for minimal cover prefix via single-child directory collapsing."""
 
-    def test_single_child_chain_collapses(self, tmp_path: pathlib.Path) -> None:
+    def test_single_child_chain_collapses(
+        self, collapse_trees: dict[str, pathlib.Path]
+    ) -> None:
         """a/b/c (file) with no siblings → register a/b (dir)."""
-        (tmp_path / "a" / "b").mkdir(parents=True)
-        (tmp_path / "a" / "b" / "c").touch()
-
         entry = MountEntry(source="./", exclude=[])
-        result = entry.resolve(tmp_path)
+        result = entry.resolve(collapse_trees["single_chain"])
         assert "a/b" in result
         assert result["a/b"].is_dir
 
     def test_no_collapse_with_multiple_children(
-        self, tmp_path: pathlib.Path
+        self, collapse_trees: dict[str, pathlib.Path]
     ) -> None:
         """a/ has two children → no collapsing."""
-        (tmp_path / "a").mkdir()
-        (tmp_path / "a" / "x").mkdir()
-        (tmp_path / "a" / "y").mkdir()
-        (tmp_path / "a" / "x" / "f.txt").touch()
-        (tmp_path / "a" / "y" / "g.txt").touch()
-
         entry = MountEntry(source="./", exclude=[])
-        result = entry.resolve(tmp_path)
+        result = entry.resolve(collapse_trees["multi_child"])
         assert "a" in result
         assert result["a"].is_dir
 
     def test_no_collapse_with_file_sibling(
-        self, tmp_path: pathlib.Path
+        self, collapse_trees: dict[str, pathlib.Path]
     ) -> None:
         """a/ has a dir and a file → no collapsing."""
-        (tmp_path / "a").mkdir()
-        (tmp_path / "a" / "sub").mkdir()
-        (tmp_path / "a" / "readme.txt").touch()
-
         entry = MountEntry(source="./", exclude=[])
-        result = entry.resolve(tmp_path)
+        result = entry.resolve(collapse_trees["file_sibling"])
         assert "a" in result
 
-    def test_deep_chain_collapses(self, tmp_path: pathlib.Path) -> None:
+    def test_deep_chain_collapses(
+        self, collapse_trees: dict[str, pathlib.Path]
+    ) -> None:
         """a/b/c/d/ with single-child chain → collapse to a/b/c/d."""
-        (tmp_path / "a" / "b" / "c" / "d").mkdir(parents=True)
-        (tmp_path / "a" / "b" / "c" / "d" / "file.txt").touch()
-
         entry = MountEntry(source="./", exclude=[])
-        result = entry.resolve(tmp_path)
+        result = entry.resolve(collapse_trees["deep_chain"])
         assert "a/b/c/d" in result
         assert result["a/b/c/d"].is_dir
 
-    def test_collapse_respects_exclude(self, tmp_path: pathlib.Path) -> None:
+    def test_collapse_respects_exclude(
+        self, collapse_trees: dict[str, pathlib.Path]
+    ) -> None:
         """Excluded siblings don't prevent collapsing."""
-        (tmp_path / "a").mkdir()
-        (tmp_path / "a" / "real").mkdir()
-        (tmp_path / "a" / "__pycache__").mkdir()
-        (tmp_path / "a" / "real" / "f.txt").touch()
-
         entry = MountEntry(source="./", exclude=["__pycache__"])
-        result = entry.resolve(tmp_path)
+        result = entry.resolve(collapse_trees["excluded_sibling"])
         assert "a/real" in result
         assert result["a/real"].is_dir
 
-    def test_collapse_with_prefix(self, tmp_path: pathlib.Path) -> None:
+    def test_collapse_with_prefix(
+        self, collapse_trees: dict[str, pathlib.Path]
+    ) -> None:
         """Collapsing works with non-empty dest prefix."""
-        (tmp_path / "a" / "b").mkdir(parents=True)
-        (tmp_path / "a" / "b" / "f.txt").touch()
-
         entry = MountEntry(source="./", dest="libs", exclude=[])
-        result = entry.resolve(tmp_path)
+        result = entry.resolve(collapse_trees["single_chain"])
         assert "libs/a/b" in result
 
 
@@ -219,21 +277,8 @@ class TestManifest:
 class TestManifestLoad:
     """Tests for loading Manifest from YAML files."""
 
-    def test_load_basic_manifest(self, tmp_path: pathlib.Path) -> None:
-        yaml_content = """\
-apiVersion: nue/v1
-mounts:
-- source: ./sources/project-a/
-  exclude:
-    - '*.pyc'
-    - __pycache__/
-    - .git/
-- source: ./sources/libs
-  dest: vendor
-"""
-        (tmp_path / "nue.yaml").write_text(yaml_content)
-
-        manifest = Manifest.load(config_path=tmp_path / "nue.yaml")
+    def test_load_basic_manifest(self, manifest_yaml_dir: pathlib.Path) -> None:
+        manifest = Manifest.load(config_path=manifest_yaml_dir / "basic" / "nue.yaml")
 
         assert manifest.apiVersion == "nue/v1"
         assert len(manifest.mounts) == 2
@@ -248,30 +293,48 @@ mounts:
         assert second.source == "./sources/libs"
         assert second.dest == "vendor"
 
-    def test_load_multi_mount_manifest(self, tmp_path: pathlib.Path) -> None:
-        yaml_content = """\
-apiVersion: nue/v1
-mounts:
-- source: ./sources/base/
-- source: ./sources/override/
-"""
-        (tmp_path / "nue.yaml").write_text(yaml_content)
-
-        manifest = Manifest.load(config_path=tmp_path / "nue.yaml")
+    def test_load_multi_mount_manifest(self, manifest_yaml_dir: pathlib.Path) -> None:
+        manifest = Manifest.load(config_path=manifest_yaml_dir / "multi" / "nue.yaml")
 
         assert len(manifest.mounts) == 2
 
-    def test_load_nonexistent_manifest(self, tmp_path: pathlib.Path) -> None:
-        manifest = Manifest.load(config_path=tmp_path / "nue.yaml")
+    def test_load_nonexistent_manifest(self, manifest_yaml_dir: pathlib.Path) -> None:
+        manifest = Manifest.load(config_path=manifest_yaml_dir / "nue.yaml")
         assert manifest.mounts == []
 
-    def test_load_from_fixtures(self) -> None:
-        fixtures = pathlib.Path(__file__).parent / "fixtures"
-
-        manifest = Manifest.load(config_path=fixtures / "nue.yaml")
-        assert len(manifest.mounts) == 2
-        assert manifest.mounts[0].source == "./sources/project-a/"
-        assert len(manifest.mounts[0].exclude) == 3
-
-        multi = Manifest.load(config_path=fixtures / "nue-multi.yaml")
-        assert len(multi.mounts) == 2
+    def test_load_from_fixtures(
+        self, basic_manifest: Manifest, multi_manifest: Manifest
+    ) -> None:
+        assert len(basic_manifest.mounts) == 2
+        assert basic_manifest.mounts[0].source == "./sources/project-a/"
+        assert len(basic_manifest.mounts[0].exclude) == 3
+
+        assert len(multi_manifest.mounts) == 2
+
+
+class TestRenderEntries:
+    """Tests for the merged-tree renderer."""
+
+    def test_directories_sort_before_dotted_siblings(self) -> None:
+        """Entries sort by path component, so foo/ precedes foo-x and foo.txt."""
+        from rich.tree import Tree
+
+        entries = {
+            vpath: nuefs.ManifestEntry(vpath, f"/backend/{vpath}", is_dir)
+            for vpath, is_dir in (
+                ("foo.txt", False),
+                ("foo-x", False),
+                ("foo/bar", True),
+            )
+        }
+        tree = Tree("root")
+        _render_entries(tree, entries)
+
+        labels = [str(node.label) for node in tree.children]
+        assert labels == [
+            "[bold cyan]foo/[/]",
+            "foo-x [dim]→ /backend/foo-x[/]",
+            "foo.txt [dim]→ /backend/foo.txt[/]",
+        ]
+        (bar,) = tree.children[0].children
+        assert str(bar.label) == "[bold cyan]bar/[/] [dim]→ /backend/foo/bar[/]"